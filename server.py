@@ -9,9 +9,19 @@ It provides two main functionalities:
 
 import os
 import re
+import sys
+import math
+import time
+import zlib
+import hashlib
+import asyncio
 import logging
-import traceback
-from typing import List, Dict, Any, Optional
+import threading
+import uuid
+from collections import OrderedDict, Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple, Iterable, Union
 import httpx
 import uvicorn
 from fastmcp import FastMCP
@@ -24,13 +34,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
 # Initialize FastMCP server
 mcp = FastMCP(
     name="OpenBB Docs Server",
     instructions="""
     This server provides access to OpenBB Workspace documentation.
-    Use 'discover_openbb_sections' to find available documentation sections,
+    Use 'identify_openbb_docs_sections' to find available documentation sections,
     then use 'fetch_openbb_content' to retrieve specific section content.
+    Optionally, 'answer_openbb_query' returns that content in one call when a very
+    similar question was answered before.
     """
 )
 
@@ -56,10 +69,272 @@ app.add_middleware(
     max_age=86400,
 )
 
+# A TOC line is either a markdown heading (category) or a list item linking to a section
+# (a bytes pattern: the TOC is scanned undecoded and only the captured groups are decoded)
+_TOC_LINE_RE = re.compile(
+    rb'^[ \t]*#+[ \t]*(?P<hdr>[^\n]+?)[ \t\r]*$'
+    rb'|^[ \t]*(?:[-*]|\d+\.)[^\n]*?\[(?P<title>[^\]\n]+)\]\((?P<url>[^)\n]+)\)'
+    # Markdown emphasis and separators between the link and its description are not summary text
+    rb'(?:[ \t*_:|-]|\xe2\x80[\x93\x94])*(?P<summary>[^\n]*)',
+    re.MULTILINE,
+)
+
+# A line naming a full-docs section: "title:" in any case, after optional indentation.
+# Matching the preceding newline lets the regex engine skip ahead to line starts quickly;
+# the first line of the file has no newline before it, so it gets its own pattern.
+_TITLE_LINE_RE = re.compile(r'\n[ \t]*title:', re.IGNORECASE)
+_FIRST_TITLE_LINE_RE = re.compile(r'[ \t]*title:', re.IGNORECASE)
+
 # URLs for OpenBB documentation
 TOC_URL = "https://docs.openbb.co/workspace/llms.txt"
 FULL_DOCS_URL = "https://docs.openbb.co/workspace/llms-full.txt"
 
+# Return the unmodified llms.txt as raw_toc_content instead of the compact listing (for debugging)
+RETURN_RAW_TOC = os.environ.get("RETURN_RAW_TOC", "").lower() in ("1", "true", "yes")
+
+# How long (in seconds) fetched documentation is served from memory before revalidating
+DOCS_CACHE_TTL = 300
+
+# Cached documents are kept zlib-compressed; their decompressed text is dropped again
+# after this many seconds without use
+DECODED_IDLE_TTL = 60
+
+# Section titles chosen for a past query are reused for new queries at least this similar
+# (cosine similarity of their content words), for at most this many remembered queries.
+# The cache is shared by every client and fed from the queries and titles they pass to
+# fetch_openbb_content, so titles are only served once the same titles have been fetched
+# for a query this many times. A client repeating its own call can still confirm an entry,
+# but the most it can do is make answer_openbb_query return other public docs sections.
+QUERY_CACHE_THRESHOLD = 0.87
+QUERY_CACHE_SIZE = 1024
+QUERY_CACHE_MIN_CONFIRMATIONS = 2
+
+# Shared HTTP client so keep-alive connections (and their TLS sessions) are reused across tool calls
+_CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=60.0,
+    limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=120),
+)
+
+# FastMCP's http_app() installs its own lifespan (so Starlette shutdown event handlers are never run);
+# wrap it to close the shared client when the server stops
+_mcp_lifespan = app.router.lifespan_context
+
+
+@asynccontextmanager
+async def _lifespan(starlette_app):
+    try:
+        async with _mcp_lifespan(starlette_app) as state:
+            yield state
+    finally:
+        await _CLIENT.aclose()
+
+
+app.router.lifespan_context = _lifespan
+
+
+class _CacheEntry(NamedTuple):
+    blob: bytes  # zlib-compressed response body
+    etag: Optional[str]
+    fetched_at: float
+    digest: bytes  # blake2b digest of the uncompressed body
+
+
+@dataclass
+class _DocCache:
+    """In-process cache of fetched documents, keyed by URL."""
+    entries: Dict[str, _CacheEntry] = field(default_factory=dict)
+    locks: Dict[str, asyncio.Lock] = field(default_factory=dict)
+    # Most recently decompressed body per URL: url -> (blob it came from, text or raw bytes)
+    decoded: Dict[str, Tuple[bytes, Union[str, bytes]]] = field(default_factory=dict)
+    expiry: Dict[str, asyncio.TimerHandle] = field(default_factory=dict)
+
+    def lock_for(self, url: str) -> asyncio.Lock:
+        if url not in self.locks:
+            self.locks[url] = asyncio.Lock()
+        return self.locks[url]
+
+    def _arm_expiry(self, url: str) -> None:
+        """(Re)start the timer that drops the decompressed body of `url` once it goes unused."""
+        handle = self.expiry.pop(url, None)
+        if handle is not None:
+            handle.cancel()
+        self.expiry[url] = asyncio.get_running_loop().call_later(DECODED_IDLE_TTL, self.decoded.pop, url, None)
+
+    def seed(self, url: str, entry: _CacheEntry, value: Union[str, bytes]) -> None:
+        """Keep the already decompressed body of a freshly fetched `entry`."""
+        self.decoded[url] = (entry.blob, value)
+        self._arm_expiry(url)
+
+    async def body(self, url: str, entry: _CacheEntry, as_text: bool) -> Union[str, bytes]:
+        """Return the decompressed body of `entry` (decoded to str if `as_text`), reusing the
+        last decompression of `url`. Decompressing runs in a worker thread."""
+        self._arm_expiry(url)
+
+        decoded = self.decoded.get(url)
+        if decoded is None or decoded[0] is not entry.blob or isinstance(decoded[1], str) != as_text:
+            decoded = (entry.blob, await asyncio.to_thread(_unpack_body, entry.blob, as_text))
+            self.decoded[url] = decoded
+        return decoded[1]
+
+
+_doc_cache = _DocCache()
+
+
+def _decode_body(body: bytes, as_text: bool) -> Union[str, bytes]:
+    return body.decode("utf-8", errors="replace") if as_text else body
+
+
+def _pack_body(body: bytes, as_text: bool) -> Tuple[bytes, bytes, Union[str, bytes]]:
+    """Compress and digest a fetched body for the cache, also returning it decoded for immediate use."""
+    return zlib.compress(body), hashlib.blake2b(body, digest_size=8).digest(), _decode_body(body, as_text)
+
+
+def _unpack_body(blob: bytes, as_text: bool) -> Union[str, bytes]:
+    return _decode_body(zlib.decompress(blob), as_text)
+
+
+class _LRUCache(OrderedDict):
+    """Small bounded mapping that evicts the least recently used entry once full."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def lookup(self, key: Any) -> Any:
+        if key not in self:
+            return None
+        self.move_to_end(key)
+        return self[key]
+
+    def store(self, key: Any, value: Any) -> None:
+        self[key] = value
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+# Parsed TOCs keyed by a digest of the raw text: digest -> (parsed_sections, section_url_map)
+_toc_cache = _LRUCache(maxsize=4)
+
+# Section indexes of the full docs keyed by a digest of the text: digest -> _SectionIndex
+# (guarded by a lock since extraction runs in worker threads)
+_section_index_cache = _LRUCache(maxsize=2)
+_section_index_lock = threading.Lock()
+
+# Extracted content per request: (section_titles, toc digest, docs digest) -> sections_with_urls
+# (the same dicts are returned to every caller, so they must never be mutated)
+_content_cache = _LRUCache(maxsize=256)
+
+_QUERY_TOKEN_RE = re.compile(r'\w+')
+_QUERY_STOPWORDS = frozenset({
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "for", "with", "from", "by", "at",
+    "is", "are", "be", "can", "do", "does", "i", "my", "me", "we", "you", "it", "this", "that",
+    "how", "what", "where", "when", "which", "why", "show", "tell", "about", "please", "openbb",
+})
+
+
+def _query_vector(user_query: str) -> Dict[str, float]:
+    """Unit-length bag-of-words vector of the content words in a query."""
+    counts = Counter(
+        token for token in _QUERY_TOKEN_RE.findall(user_query.lower())
+        if token not in _QUERY_STOPWORDS
+    )
+    norm = math.sqrt(sum(count * count for count in counts.values()))
+    return {token: count / norm for token, count in counts.items()} if norm else {}
+
+
+class _QueryCache:
+    """Section titles previously chosen for user queries, looked up by query similarity.
+
+    Lets a repeated (or near-identical) question skip the identify -> select -> fetch round-trip.
+    """
+
+    def __init__(self, maxsize: int, threshold: float, min_confirmations: int):
+        # Sorted query words -> (query vector, section titles, times those titles were recorded)
+        self.entries = _LRUCache(maxsize)
+        self.threshold = threshold
+        self.min_confirmations = min_confirmations
+
+    def lookup(self, user_query: str) -> Optional[List[str]]:
+        vector = _query_vector(user_query)
+        if not vector:
+            return None
+
+        exact = self.entries.lookup(tuple(sorted(vector)))
+        if exact is not None and exact[2] >= self.min_confirmations:
+            return exact[1]
+
+        best_key, best_score = None, self.threshold
+        for key, (other, _, confirmations) in self.entries.items():
+            if confirmations < self.min_confirmations:
+                continue
+            score = sum(weight * other.get(token, 0.0) for token, weight in vector.items())
+            if score >= best_score:
+                best_key, best_score = key, score
+        return self.entries.lookup(best_key)[1] if best_key is not None else None
+
+    def record(self, user_query: str, section_titles: List[str]) -> None:
+        vector = _query_vector(user_query)
+        if not (vector and section_titles):
+            return
+
+        key = tuple(sorted(vector))
+        previous = self.entries.get(key)
+        confirmations = previous[2] + 1 if previous is not None and previous[1] == section_titles else 1
+        self.entries.store(key, (vector, list(section_titles), confirmations))
+
+
+_query_cache = _QueryCache(
+    maxsize=QUERY_CACHE_SIZE, threshold=QUERY_CACHE_THRESHOLD, min_confirmations=QUERY_CACHE_MIN_CONFIRMATIONS
+)
+
+
+async def _get_cached(
+    url: str, ttl: float = DOCS_CACHE_TTL, as_text: bool = True
+) -> Tuple[Union[str, bytes], bytes]:
+    """Return the body of `url` (as str, or raw bytes unless `as_text`) and its digest."""
+    entry = await _get_entry(url, ttl, as_text)
+    return await _doc_cache.body(url, entry, as_text), entry.digest
+
+
+async def _get_entry(url: str, ttl: float = DOCS_CACHE_TTL, as_text: bool = True) -> _CacheEntry:
+    """Return the cache entry of `url`, only going to the network once it is older than `ttl`.
+
+    Stale entries are revalidated with If-None-Match, so an unchanged document costs a 304
+    instead of a full download. The per-URL lock makes concurrent callers share a single fetch.
+    The body is not decompressed here; `as_text` only says how to keep a freshly fetched body.
+    """
+    entry = _doc_cache.entries.get(url)
+    if entry is not None and time.monotonic() - entry.fetched_at < ttl:
+        return entry
+
+    async with _doc_cache.lock_for(url):
+        # Another caller may have refreshed the entry while we were waiting for the lock
+        entry = _doc_cache.entries.get(url)
+        if entry is not None and time.monotonic() - entry.fetched_at < ttl:
+            return entry
+
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        response = await _CLIENT.get(url, headers=headers)
+
+        if entry is not None and response.status_code == 304:
+            entry = entry._replace(fetched_at=time.monotonic())
+        else:
+            response.raise_for_status()
+            blob, digest, value = await asyncio.to_thread(_pack_body, response.content, as_text)
+            entry = _CacheEntry(
+                blob=blob,
+                etag=response.headers.get("ETag"),
+                fetched_at=time.monotonic(),
+                digest=digest,
+            )
+            # Seed the decompressed slot so the fresh body is not immediately decompressed again
+            _doc_cache.seed(url, entry, value)
+
+        _doc_cache.entries[url] = entry
+        return entry
+
 
 @mcp.tool()
 async def identify_openbb_docs_sections(user_query: str) -> Dict[str, Any]:
@@ -71,7 +346,8 @@ async def identify_openbb_docs_sections(user_query: str) -> Dict[str, Any]:
 
     RETURN VALUE:
     Returns a dictionary containing:
-    - raw_toc_content: The complete table of contents with all sections and descriptions
+    - raw_toc_content: The complete table of contents, one "## Category" heading per category
+      followed by one "- Section Title: description" line per section
     - section_urls: A mapping of section titles to their URLs
     - query: The original user query for reference
 
@@ -92,7 +368,7 @@ async def identify_openbb_docs_sections(user_query: str) -> Dict[str, Any]:
 
     NEXT STEPS:
     After analyzing the TOC, call fetch_openbb_content with:
-    - A list of up to 3 exact section titles (copy them exactly as they appear in raw_toc_content)
+    - A list of up to 3 exact section titles (copy them exactly as they appear between the square brackets in raw_toc_content)
     - The original user_query
     - Maximum 3 sections (can be 0, 1, 2, or 3), ranked by relevance
     - Empty list if truly no relevant sections exist
@@ -107,8 +383,7 @@ async def identify_openbb_docs_sections(user_query: str) -> Dict[str, Any]:
         result = await _identify_sections_async(user_query)
         return result
     except Exception as e:
-        logger.error(f"[TOOL ERROR] identify_openbb_docs_sections failed: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"[TOOL ERROR] identify_openbb_docs_sections failed: {str(e)}")
         raise
 
 
@@ -194,171 +469,277 @@ async def fetch_openbb_content(section_titles: List[str], user_query: str) -> Di
         result = await _fetch_content_async(section_titles, user_query)
         return result
     except Exception as e:
-        logger.error(f"[TOOL ERROR] fetch_openbb_content failed: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"[TOOL ERROR] fetch_openbb_content failed: {str(e)}")
+        raise
+
+
+@mcp.tool()
+async def answer_openbb_query(user_query: str) -> Dict[str, Any]:
+    """
+    Answer an OpenBB documentation question directly when a very similar question was
+    already answered, skipping the identify/fetch steps.
+
+    This tool is optional: the normal workflow is 'identify_openbb_docs_sections', then
+    'fetch_openbb_content', and a cache miss here costs an extra tool call. Use it for
+    common questions that are likely to have been asked before.
+
+    If 'cache_hit' is true, the result has the same shape as fetch_openbb_content's result:
+    use 'extracted_content' to answer the user, following the RESPONSE GUIDELINES of
+    'fetch_openbb_content'. If 'cache_hit' is false, continue with the normal workflow.
+
+    Args:
+        user_query: The user's question or information request
+
+    Returns:
+        Dict with 'success', 'cache_hit' and 'user_query' fields; on a cache hit also
+        'section_titles', 'extracted_content' and 'sections_found'
+    """
+    try:
+        result = await _answer_query_async(user_query)
+        return result
+    except Exception as e:
+        logger.exception(f"[TOOL ERROR] answer_openbb_query failed: {str(e)}")
         raise
 
 
+async def _answer_query_async(user_query: str) -> Dict[str, Any]:
+    """
+    Serve a query from the sections chosen for a similar earlier query, if there is one.
+    Content is re-extracted (from cache) so it always reflects the current docs.
+    """
+    section_titles = _query_cache.lookup(user_query)
+    if section_titles is None:
+        return {
+            "success": True,
+            "cache_hit": False,
+            "user_query": user_query
+        }
+
+    # Not recorded: the titles were our own guess for this query, not a client's choice
+    result = await _fetch_content_async(section_titles, user_query, record=False)
+    result["cache_hit"] = result["success"]
+    result["section_titles"] = section_titles
+    return result
+
+
 async def _identify_sections_async(user_query: str) -> Dict[str, Any]:
     """
     Async implementation for identifying relevant sections.
-    Returns the raw TOC content for LLM to analyze and select relevant sections.
+    Returns the TOC content for LLM to analyze and select relevant sections.
     """
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(TOC_URL)
-            response.raise_for_status()
-            toc_content = response.text
+        toc_content, toc_key = await _get_cached(TOC_URL, as_text=False)
 
-        # Parse TOC to extract section titles and URLs
-        parsed_sections = _parse_toc(toc_content)
+        # Parse TOC to extract section titles and a title -> URL mapping for easy lookup
+        parsed_sections, section_url_map = _parse_toc_cached(toc_content, toc_key)
 
-        # Create a mapping of section titles to URLs for easy lookup
-        section_url_map = {
-            section["title"]: section["url"]
-            for section in parsed_sections
-        }
+        # Only the compact listing goes back to the LLM unless the raw file was asked for
+        if RETURN_RAW_TOC:
+            toc_for_llm = toc_content.decode("utf-8", errors="replace")
+        else:
+            toc_for_llm = _compact_toc(parsed_sections)
 
         return {
             "success": True,
             "query": user_query,
-            "raw_toc_content": toc_content,
+            "raw_toc_content": toc_for_llm,
             "section_urls": section_url_map
         }
 
     except Exception as e:
-        logger.error(f"ERROR in _identify_sections_async: {str(e)}")
-        logger.error(f"Exception type: {type(e).__name__}")
-        logger.error(f"Full traceback:\n{traceback.format_exc()}")
+        # The traceback stays in the server log; clients get an id to correlate with it
+        error_id = uuid.uuid4().hex[:8]
+        logger.exception(f"ERROR in _identify_sections_async [error_id={error_id}]: {type(e).__name__}: {str(e)}")
         return {
             "success": False,
             "error": str(e),
             "error_type": type(e).__name__,
-            "traceback": traceback.format_exc(),
+            "error_id": error_id,
             "query": user_query,
             "raw_toc_content": ""
         }
 
 
-async def _fetch_content_async(section_titles: List[str], user_query: str) -> Dict[str, Any]:
+async def _get_section_url_map() -> Tuple[Dict[str, str], bytes]:
+    """Return the TOC's title -> URL map and the TOC digest. The TOC is only refetched once its
+    cached copy is stale, and only reparsed when its content changed."""
+    toc_content, toc_key = await _get_cached(TOC_URL, as_text=False)
+    _, section_url_map = _parse_toc_cached(toc_content, toc_key)
+    return section_url_map, toc_key
+
+
+async def _fetch_content_async(
+    section_titles: List[str], user_query: str, record: bool = True
+) -> Dict[str, Any]:
     """
     Fetch full documentation and extract only the relevant sections.
     Returns extracted content with the original user query and instructions for the LLM.
+    `record` remembers the titles for answer_openbb_query; only titles chosen by a client count.
     """
     try:
-        # Fetch both the TOC (for URLs) and full documentation
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            toc_response = await client.get(TOC_URL)
-            toc_response.raise_for_status()
-            toc_content = toc_response.text
-
-            docs_response = await client.get(FULL_DOCS_URL)
-            docs_response.raise_for_status()
-            full_docs = docs_response.text
-
-        # Parse TOC to get section URLs
-        parsed_sections = _parse_toc(toc_content)
-        section_url_map = {
-            section["title"]: section["url"]
-            for section in parsed_sections
-        }
-
-        # Extract only the relevant sections from the full docs
-        # This prevents sending the entire docs which would exceed context limits
-        content_sections = _extract_sections_from_docs(full_docs, section_titles)
-
-        # Build section content with URLs
-        sections_with_urls = {}
-        for title, content in content_sections.items():
-            url = section_url_map.get(title, "URL not found")
-            sections_with_urls[title] = {
-                "url": url,
-                "content": content
-            }
+        # Get the section URLs and the full documentation concurrently
+        (section_url_map, toc_key), docs_entry = await asyncio.gather(
+            _get_section_url_map(),
+            _get_entry(FULL_DOCS_URL),
+        )
+        docs_key = docs_entry.digest
+
+        # Repeated requests for the same sections against unchanged docs reuse the earlier result,
+        # without decompressing the docs at all
+        cache_key = (tuple(section_titles), toc_key, docs_key)
+        sections_with_urls = _content_cache.lookup(cache_key)
+
+        if sections_with_urls is None:
+            full_docs = await _doc_cache.body(FULL_DOCS_URL, docs_entry, as_text=True)
+
+            # Extract only the relevant sections from the full docs
+            # This prevents sending the entire docs which would exceed context limits
+            # Scanning multi-MB docs is CPU-bound, so keep it off the event loop
+            content_sections = await asyncio.to_thread(
+                _extract_sections_from_docs, full_docs, section_titles, docs_key
+            )
+
+            # Build section content with URLs
+            sections_with_urls = {}
+            for title, content in content_sections.items():
+                url = section_url_map.get(title, "URL not found")
+                sections_with_urls[title] = {
+                    "url": url,
+                    "content": content
+                }
+            _content_cache.store(cache_key, sections_with_urls)
+
+        # Remember which (existing) sections answered this query for answer_openbb_query
+        if record:
+            _query_cache.record(user_query, [
+                title for title, section in sections_with_urls.items()
+                if section["url"] != "URL not found"
+            ])
 
         return {
             "success": True,
             "user_query": user_query,
             "extracted_content": sections_with_urls,
-            "sections_found": len(content_sections)
+            "sections_found": len(sections_with_urls)
         }
 
     except Exception as e:
-        logger.error(f"ERROR in _fetch_content_async: {str(e)}")
-        logger.error(f"Exception type: {type(e).__name__}")
-        logger.error(f"Full traceback:\n{traceback.format_exc()}")
+        error_id = uuid.uuid4().hex[:8]
+        logger.exception(f"ERROR in _fetch_content_async [error_id={error_id}]: {type(e).__name__}: {str(e)}")
         return {
             "success": False,
             "error": str(e),
             "error_type": type(e).__name__,
-            "traceback": traceback.format_exc(),
+            "error_id": error_id,
             "user_query": user_query,
             "extracted_content": {}
         }
 
 
-def _parse_toc(toc_content: str, query: Optional[str] = None) -> List[Dict[str, str]]:
+def _parse_toc(toc_content: bytes, query: Optional[str] = None) -> List[Dict[str, str]]:
     """Parse the table of contents and extract section information."""
     sections = []
-    lines = toc_content.strip().split('\n')
-
     current_category = ""
+    query_lower = query.lower() if query else None
 
-    for line in lines:
-        line = line.strip()
-
-        # Skip empty lines
-        if not line:
+    for match in _TOC_LINE_RE.finditer(toc_content):
+        # Markdown headings start a new category
+        if match.group("hdr") is not None:
+            current_category = match.group("hdr").decode("utf-8", errors="replace").replace('#', '').strip()
             continue
 
-        # Detect category headers (lines that don't start with - or *)
-        if not line.startswith(('-', '*', '1.', '2.', '3.', '4.', '5.')):
-            # Check if it's a main section header
-            if line and not line.startswith('#') and not line.startswith('http'):
-                current_category = line.replace('#', '').strip()
+        title = sys.intern(match.group("title").decode("utf-8", errors="replace").strip())
+        url = match.group("url").decode("utf-8", errors="replace").strip()
+        summary = match.group("summary").decode("utf-8", errors="replace").strip()
+
+        # Filter by query if provided
+        if query_lower and query_lower not in title.lower() and query_lower not in current_category.lower():
             continue
 
-        # Extract markdown links
-        link_match = re.search(r'\[([^\]]+)\]\(([^)]+)\)', line)
-        if link_match:
-            title = link_match.group(1).strip()
-            url = link_match.group(2).strip()
+        sections.append({
+            "title": title,
+            "category": current_category,
+            "url": url,
+            "summary": summary,
+            "description": f"{current_category}: {title}" if current_category else title
+        })
 
-            # Filter by query if provided
-            if query and query.lower() not in title.lower() and query.lower() not in current_category.lower():
-                continue
+    return sections
 
-            sections.append({
-                "title": title,
-                "category": current_category,
-                "url": url,
-                "description": f"{current_category}: {title}" if current_category else title
-            })
 
-    return sections
+def _compact_toc(parsed_sections: List[Dict[str, str]]) -> str:
+    """Render parsed TOC sections as one heading per category and one "- [Title]: summary" line
+    per section (URLs are returned separately in section_urls). Titles never contain ']', so the
+    brackets delimit them unambiguously."""
+    lines = []
+    current_category = None
+    for section in parsed_sections:
+        if section["category"] != current_category:
+            current_category = section["category"]
+            if current_category:
+                lines.append(f"## {current_category}")
+        if section["summary"]:
+            lines.append(f"- [{section['title']}]: {section['summary']}")
+        else:
+            lines.append(f"- [{section['title']}]")
+    return "\n".join(lines)
+
+
+def _parse_toc_cached(toc_content: bytes, key: bytes) -> Tuple[List[Dict[str, str]], Dict[str, str]]:
+    """Parse the TOC and build its title -> URL map, reusing the result for an unchanged TOC.
+
+    `key` is the TOC's content digest (see _get_cached).
+    """
+    cached = _toc_cache.lookup(key)
+    if cached is None:
+        parsed_sections = _parse_toc(toc_content)
+        section_url_map = {
+            section["title"]: section["url"]
+            for section in parsed_sections
+        }
+        cached = (parsed_sections, section_url_map)
+        _toc_cache.store(key, cached)
+    return cached
 
 
-def _extract_sections_from_docs(full_docs: str, section_titles: List[str]) -> Dict[str, str]:
+def _extract_sections_from_docs(
+    full_docs: str, section_titles: List[str], docs_key: bytes
+) -> Dict[str, str]:
     """Extract specific sections from the full documentation."""
+    # Requested title -> lowercased index key, computed once per distinct title
+    wanted = {title: title.lower() for title in section_titles}
+    found = _extract_many(full_docs, wanted.values(), docs_key)
     content_sections = {}
 
-    for title in section_titles:
-        try:
-            section_content = _find_section_content(full_docs, title)
-            if section_content:
-                content_sections[title] = section_content
-            else:
-                content_sections[title] = f"Section '{title}' not found in documentation."
-        except Exception as e:
-            logger.error(f"Error extracting section '{title}': {str(e)}")
-            logger.error(traceback.format_exc())
-            content_sections[title] = f"Error extracting section '{title}': {str(e)}"
+    for title, title_lower in wanted.items():
+        section_content = found.get(title_lower)
+        if section_content:
+            content_sections[title] = section_content
+        else:
+            content_sections[title] = f"Section '{title}' not found in documentation."
 
     return content_sections
 
 
-def _find_section_content(full_docs: str, title: str) -> Optional[str]:
-    """Find content for a specific section title in the full docs.
+def _extract_many(full_docs: str, titles: Iterable[str], key: bytes) -> Dict[str, str]:
+    """Return the content of each of the lowercased `titles` found in the docs, keyed by title.
+
+    `key` is the docs' content digest (see _get_cached).
+    """
+    with _section_index_lock:
+        index = _section_index_cache.lookup(key)
+        if index is None:
+            index = _SectionIndex()
+            _section_index_cache.store(key, index)
+
+    return {
+        title: full_docs[start:end]
+        for title, (start, end) in index.find(full_docs, titles).items()
+    }
+
+
+class _SectionIndex:
+    """Offsets of the full-docs sections by lowercased title, filled in lazily.
 
     Sections are in YAML frontmatter format:
     ---
@@ -371,48 +752,92 @@ def _find_section_content(full_docs: str, title: str) -> Optional[str]:
     ---
     title: Next Section
     ---
-    """
-    lines = full_docs.split('\n')
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
 
-        # Look for "title: <title>" pattern
-        if line.lower().startswith('title:'):
-            # Extract the title from this line
-            section_title = line[6:].strip()  # Remove "title:" prefix
-
-            # Check if this matches our search title (case-insensitive)
-            if section_title.lower() == title.lower():
-                # Found it! Skip the frontmatter first
-                j = i + 1
-
-                # Skip until we find the closing --- of frontmatter
-                while j < len(lines) and lines[j].strip() != '---':
-                    j += 1
-
-                # Now j is at the closing ---, move past it
-                j += 1
-
-                # Collect content until we hit the next section (--- followed by blank line and ---)
-                content_lines = []
-                while j < len(lines):
-                    # Check if we're at the start of next section
-                    # Pattern is: ---\n\n--- or ---\n---
-                    if (lines[j].strip() == '---' and
-                        j + 1 < len(lines) and
-                        (lines[j + 1].strip() == '---' or lines[j + 1].strip() == '')):
-                        break
-
-                    content_lines.append(lines[j])
-                    j += 1
+    The docs are scanned top-down only as far as needed to answer the titles asked for so
+    far, and later lookups resume where the last scan stopped. Only offsets are kept, so the
+    index holds no reference to the (large) docs text itself.
+    """
 
-                return '\n'.join(content_lines)
+    def __init__(self):
+        self.spans: Dict[str, Tuple[int, int]] = {}
+        self.pos = 0
+        self.complete = False
+        self.lock = threading.Lock()
+
+    def find(self, full_docs: str, titles: Iterable[str]) -> Dict[str, Tuple[int, int]]:
+        """Return the (start, end) content offsets of those `titles` present in the docs."""
+        titles = set(titles)
+        with self.lock:
+            missing = titles - self.spans.keys()
+            while missing and not self.complete:
+                title = self._scan_next(full_docs)
+                missing.discard(title)
+            return {title: self.spans[title] for title in titles if title in self.spans}
+
+    def _scan_next(self, full_docs: str) -> Optional[str]:
+        """Index the next "title:" line after the scan position and return its title."""
+        # The scan position is always at a line start, so the newline before it is at pos - 1
+        match = _FIRST_TITLE_LINE_RE.match(full_docs) if self.pos == 0 else None
+        if match is None:
+            match = _TITLE_LINE_RE.search(full_docs, max(self.pos - 1, 0))
+        if match is None:
+            self.complete = True
+            return None
+        line_end = full_docs.find('\n', match.end())
+        if line_end == -1:
+            line_end = len(full_docs)
+        self.pos = line_end + 1
+
+        title = sys.intern(full_docs[match.end():line_end].strip().lower())
+        # The first section with a given title wins, as with a top-down scan
+        if title in self.spans:
+            return None
+
+        # Content starts after the "---" line that closes the frontmatter
+        _, close_end = _find_dash_line(full_docs, self.pos)
+        start = min(close_end + 1, len(full_docs)) if close_end != -1 else len(full_docs)
+        self.spans[title] = (start, _find_section_end(full_docs, start))
+        return title
+
+
+def _find_dash_line(full_docs: str, pos: int) -> Tuple[int, int]:
+    """Return the (start, end) offsets of the first line at or after `pos` that is just "---".
+
+    `end` is the offset of the line's newline (or the end of the file); (-1, -1) if there is none.
+    """
+    while True:
+        idx = full_docs.find('---', pos)
+        if idx == -1:
+            return -1, -1
+        line_start = full_docs.rfind('\n', 0, idx) + 1
+        line_end = full_docs.find('\n', idx)
+        if line_end == -1:
+            line_end = len(full_docs)
+        if full_docs[line_start:line_end].strip() == '---':
+            return line_start, line_end
+        pos = line_end + 1
+
+
+def _find_section_end(full_docs: str, start: int) -> int:
+    """Find where the section body starting at `start` ends.
+
+    The body runs up to a "---" line followed by a blank line or another "---" (excluding
+    the newline before it), or to the end of the file.
+    """
+    pos = start
+    while True:
+        line_start, line_end = _find_dash_line(full_docs, pos)
+        # A "---" on the last line can't close the section: there is no line after it
+        if line_start == -1 or line_end == len(full_docs):
+            return len(full_docs)
 
-        i += 1
+        next_end = full_docs.find('\n', line_end + 1)
+        if next_end == -1:
+            next_end = len(full_docs)
+        if full_docs[line_end + 1:next_end].strip() in ('', '---'):
+            return max(start, line_start - 1)
 
-    return None
+        pos = line_end + 1
 
 
 if __name__ == "__main__":
@@ -422,7 +847,7 @@ if __name__ == "__main__":
     print("=" * 80)
     print("Starting FastMCP OpenBB Docs server...")
     print(f"MCP server will be available at: http://0.0.0.0:{port}/mcp")
-    print("Tools available: identify_openbb_docs_sections, fetch_openbb_content")
+    print("Tools available: identify_openbb_docs_sections, fetch_openbb_content, answer_openbb_query")
     print("=" * 80)
 
     # Run the MCP server with HTTP transport using uvicorn